@@ -9,7 +9,6 @@ Game duration: 40 minutes (4 quarters of 10 minutes each)
 Minimum stint duration: 2.5 minutes
 """
 
-import argparse
 import sys
 from typing import List, Tuple
 
@@ -21,8 +20,11 @@ QUARTER_DURATION = GAME_DURATION_MINUTES // QUARTERS  # 10 minutes per quarter
 PLAYERS_ON_COURT = 5
 MIN_STINT_DURATION = 2.5
 
+# Command line parser, built on first use by _get_parser
+_PARSER = None
 
-def calculate_rotation_schedule(players: List[str]) -> Tuple[List[List[str]], float, float]:
+
+def calculate_rotation_schedule(players: List[str]) -> Tuple[List[Tuple[int, ...]], float, float]:
     """
     Calculate the rotation schedule for a given list of players.
     
@@ -31,7 +33,8 @@ def calculate_rotation_schedule(players: List[str]) -> Tuple[List[List[str]], fl
         
     Returns:
         A tuple containing:
-        - Schedule matrix: list of time slots, each containing players on court
+        - Schedule matrix: list of time slots, each containing the indices
+          into players of those on court
         - Minutes per player
         - Stint duration
     """
@@ -51,30 +54,15 @@ def calculate_rotation_schedule(players: List[str]) -> Tuple[List[List[str]], fl
     actual_slot_duration = MIN_STINT_DURATION
     
     # Generate rotation using balanced round-robin approach
+    # Picking the players who have played least (and rested longest) each slot
+    # is the same as walking the roster in order, five at a time, wrapping
+    # around. Each player therefore gets floor or ceil of 5 * num_slots / N.
     schedule = []
-    player_slots_played = {p: 0 for p in players}
-    player_rested_slots = {p: 0 for p in players}  # Track rest to balance it
-    
+    next_player = 0
     for slot in range(num_slots):
-        # Sort players by: 1) least slots played, 2) most slots rested, 3) player index
-        available_players = sorted(
-            players, 
-            key=lambda p: (player_slots_played[p], -player_rested_slots[p], players.index(p))
-        )
-        
-        # Select 5 players
-        court_players = available_players[:PLAYERS_ON_COURT]
-        
-        # Update tracking
-        for player in players:
-            if player in court_players:
-                player_slots_played[player] += 1
-                player_rested_slots[player] = 0
-            else:
-                player_rested_slots[player] += 1
-        
-        schedule.append(court_players)
-    
+        schedule.append(tuple((next_player + k) % num_players for k in range(PLAYERS_ON_COURT)))
+        next_player = (next_player + PLAYERS_ON_COURT) % num_players
+
     return schedule, minutes_per_player, actual_slot_duration
 
 
@@ -94,7 +82,12 @@ def generate_detailed_schedule(players: List[str]) -> Tuple[List[dict], float, f
     schedule, minutes_per_player, slot_duration = calculate_rotation_schedule(players)
     
     detailed = []
-    for slot_idx, players_on_court in enumerate(schedule):
+    for slot_idx, players_idx in enumerate(schedule):
+        # Bit i is set if players[i] is on court
+        court_mask = 0
+        for i in players_idx:
+            court_mask |= 1 << i
+        
         start_time = slot_idx * slot_duration
         end_time = (slot_idx + 1) * slot_duration
         quarter = int(start_time // QUARTER_DURATION) + 1
@@ -105,8 +98,9 @@ def generate_detailed_schedule(players: List[str]) -> Tuple[List[dict], float, f
             'start_time': start_time,
             'end_time': end_time,
             'duration': slot_duration,
-            'players': players_on_court,
-            'on_bench': [p for p in players if p not in players_on_court]
+            'players_idx': players_idx,
+            'players': [players[i] for i in players_idx],
+            'court_mask': court_mask
         })
     
     return detailed, minutes_per_player, slot_duration
@@ -120,11 +114,15 @@ def format_time(minutes: float) -> str:
     return f"{mins:02d}:{secs:02d}"
 
 
-def generate_csv(players: List[str], filename: str = None) -> str:
+def generate_csv(schedule: List[dict], minutes_per_player: float, slot_duration: float,
+                 players: List[str], filename: str = None) -> str:
     """
     Generate a CSV file with the rotation schedule.
     
     Args:
+        schedule: Detailed schedule from generate_detailed_schedule
+        minutes_per_player: Minutes per player
+        slot_duration: Slot duration
         players: List of player names attending
         filename: Output filename (optional, will print to stdout if not provided)
         
@@ -132,37 +130,41 @@ def generate_csv(players: List[str], filename: str = None) -> str:
         CSV content as string
     """
     num_players = len(players)
-    schedule, minutes_per_player, slot_duration = generate_detailed_schedule(players)
     
-    output_lines = []
+    # Collect every field and separator in one list and join once at the end
+    parts = []
     
     # Summary header
-    output_lines.append(f"# Rotation Schedule for {num_players} Players")
-    output_lines.append(f"# Minutes per player: {minutes_per_player:.1f}")
-    output_lines.append(f"# Stint duration: {slot_duration:.1f} minutes")
-    output_lines.append("")
+    parts.append(f"# Rotation Schedule for {num_players} Players\n")
+    parts.append(f"# Minutes per player: {minutes_per_player:.1f}\n")
+    parts.append(f"# Stint duration: {slot_duration:.1f} minutes\n")
+    parts.append("\n")
     
     # CSV header
-    header = ["Slot", "Quarter", "Start", "End", "Duration (min)"]
-    header.extend(players)
-    output_lines.append(",".join(header))
+    parts.append("Slot,Quarter,Start,End,Duration (min)")
+    for player in players:
+        parts.append(",")
+        parts.append(player)
+    
+    # Cell text for bench (0) and court (1), indexed by the court mask bit
+    court_glyphs = (",0", ",1")
+    player_range = range(num_players)
+    
+    # Slot boundaries are shared between consecutive slots, so format each once
+    time_strings = [format_time(i * slot_duration) for i in range(len(schedule) + 1)]
     
     # Data rows
-    for entry in schedule:
-        row = [
-            str(entry['slot']),
-            str(entry['quarter']),
-            format_time(entry['start_time']),
-            format_time(entry['end_time']),
+    for slot_idx, entry in enumerate(schedule):
+        parts.append(
+            f"\n{entry['slot']},{entry['quarter']},"
+            f"{time_strings[slot_idx]},{time_strings[slot_idx + 1]},"
             f"{entry['duration']:.1f}"
-        ]
+        )
         # Mark which players are on court (1) or bench (0)
-        for player in players:
-            row.append("1" if player in entry['players'] else "0")
-        
-        output_lines.append(",".join(row))
+        court_mask = entry['court_mask']
+        parts.extend(court_glyphs[(court_mask >> i) & 1] for i in player_range)
     
-    content = "\n".join(output_lines)
+    content = "".join(parts)
     
     if filename:
         with open(filename, 'w', newline='') as f:
@@ -172,11 +174,15 @@ def generate_csv(players: List[str], filename: str = None) -> str:
     return content
 
 
-def generate_markdown(players: List[str], filename: str = None) -> str:
+def generate_markdown(schedule: List[dict], minutes_per_player: float, slot_duration: float,
+                      players: List[str], filename: str = None) -> str:
     """
     Generate a Markdown table with the rotation schedule.
     
     Args:
+        schedule: Detailed schedule from generate_detailed_schedule
+        minutes_per_player: Minutes per player
+        slot_duration: Slot duration
         players: List of player names attending
         filename: Output filename (optional)
         
@@ -184,7 +190,6 @@ def generate_markdown(players: List[str], filename: str = None) -> str:
         Markdown content as string
     """
     num_players = len(players)
-    schedule, minutes_per_player, slot_duration = generate_detailed_schedule(players)
     
     lines = []
     
@@ -224,50 +229,58 @@ def generate_markdown(players: List[str], filename: str = None) -> str:
     # Each row represents a court position (1-5)
     # Show player name only when there's a substitution (change from previous slot)
     # Maintain stable positions: players stay in same position if still on court
+    # Positions hold player indices; rank them by name once so that
+    # assignments follow the same alphabetical order as the names
+    name_rank = [0] * num_players
+    for rank, i in enumerate(sorted(range(num_players), key=players.__getitem__)):
+        name_rank[i] = rank
+    
     position_rows = [[] for _ in range(PLAYERS_ON_COURT)]  # 5 rows for 5 positions
     current_positions = [None] * PLAYERS_ON_COURT  # Track who is in each position
     
+    prev_mask = 0
     for slot_idx, entry in enumerate(schedule):
-        current_players_set = set(entry['players'])
-        # Sort for deterministic ordering
-        new_players = sorted(current_players_set)
+        court_mask = entry['court_mask']
         
         if slot_idx == 0:
             # First slot - assign initial positions
+            # Sort for deterministic ordering
+            new_players = sorted(entry['players_idx'], key=name_rank.__getitem__)
             for pos in range(PLAYERS_ON_COURT):
                 current_positions[pos] = new_players[pos]
-                position_rows[pos].append(new_players[pos])
+                position_rows[pos].append(players[new_players[pos]])
         else:
             # Find players leaving and entering
-            prev_players_set = set(current_positions)
-            leaving = prev_players_set - current_players_set
-            entering = current_players_set - prev_players_set
+            leaving_mask = prev_mask & ~court_mask
             # Sort for deterministic ordering
-            entering_list = sorted(entering)
+            entering_list = sorted(
+                (i for i in entry['players_idx'] if not (prev_mask >> i) & 1),
+                key=name_rank.__getitem__
+            )
+            num_leaving = bin(leaving_mask).count("1")
             
             # The number of entering players should equal leaving players
-            assert len(entering_list) == len(leaving), \
-                f"Mismatch: {len(entering_list)} entering vs {len(leaving)} leaving"
+            assert len(entering_list) == num_leaving, \
+                f"Mismatch: {len(entering_list)} entering vs {num_leaving} leaving"
             
             # Update positions: keep players who stay, replace those who leave
             entering_idx = 0
             for pos in range(PLAYERS_ON_COURT):
-                if current_positions[pos] in leaving:
+                if (leaving_mask >> current_positions[pos]) & 1:
                     # This player is leaving, replace with someone entering
                     new_player = entering_list[entering_idx]
                     entering_idx += 1
                     current_positions[pos] = new_player
-                    position_rows[pos].append(new_player)
+                    position_rows[pos].append(players[new_player])
                 else:
                     # Player stays - empty cell
                     position_rows[pos].append("")
+        
+        prev_mask = court_mask
     
     # Output the position rows
     for pos in range(PLAYERS_ON_COURT):
-        row = "|"
-        for cell in position_rows[pos]:
-            row += f"{cell}|"
-        lines.append(row)
+        lines.append("|" + "".join(f"{cell}|" for cell in position_rows[pos]))
     
     lines.append("")
     
@@ -278,20 +291,23 @@ def generate_markdown(players: List[str], filename: str = None) -> str:
     lines.append("|--------|---------------|--------|")
     
     # Calculate actual minutes per player
-    player_minutes = {p: 0 for p in players}
-    player_stints = {p: 0 for p in players}
-    
-    prev_on_court = set()
-    for entry in schedule:
-        current_on_court = set(entry['players'])
-        for player in entry['players']:
-            player_minutes[player] += entry['duration']
-            if player not in prev_on_court:
-                player_stints[player] += 1
-        prev_on_court = current_on_court
+    # Transpose the per-slot court masks into one presence mask per player,
+    # where bit s is set if the player is on court during slot s
+    presence = [0] * num_players
+    for slot_idx, entry in enumerate(schedule):
+        # Walk the set bits of the court mask, clearing the lowest each time
+        mask = entry['court_mask']
+        while mask:
+            presence[(mask & -mask).bit_length() - 1] |= 1 << slot_idx
+            mask &= mask - 1
     
-    for player in players:
-        lines.append(f"| {player} | {player_minutes[player]:.1f} | {player_stints[player]} |")
+    # Minutes come from the slots played; a stint starts at every slot the
+    # player is on court after being on the bench (or at tip-off)
+    player_minutes = [bin(p).count("1") * slot_duration for p in presence]
+    player_stints = [bin(p & ~(p << 1)).count("1") for p in presence]
+    
+    for i, player in enumerate(players):
+        lines.append(f"| {player} | {player_minutes[i]:.1f} | {player_stints[i]} |")
     
     lines.append("")
     lines.append("---")
@@ -307,7 +323,15 @@ def generate_markdown(players: List[str], filename: str = None) -> str:
     return content
 
 
-def main():
+def _get_parser():
+    """Build the command line parser once and reuse it on later calls."""
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
+    
+    # Imported here so that importing this module stays cheap
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Generate basketball rotation schedule for a list of players",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -345,7 +369,12 @@ Examples:
         help="Print output to console"
     )
     
-    args = parser.parse_args()
+    _PARSER = parser
+    return _PARSER
+
+
+def main():
+    args = _get_parser().parse_args()
     
     players = args.players
     num_players = len(players)
@@ -358,17 +387,18 @@ Examples:
     if num_players > 20:
         print("Warning: More than 20 players may result in very short stints", file=sys.stderr)
     
-    # Generate output
+    # Generate output (schedule is computed once and shared by both formats)
+    schedule, minutes_per_player, slot_duration = generate_detailed_schedule(players)
     csv_content = None
     md_content = None
     
     if args.format in ["csv", "both"]:
         csv_filename = f"{args.output}.csv" if args.output else None
-        csv_content = generate_csv(players, csv_filename)
+        csv_content = generate_csv(schedule, minutes_per_player, slot_duration, players, csv_filename)
     
     if args.format in ["markdown", "both"]:
         md_filename = f"{args.output}.md" if args.output else None
-        md_content = generate_markdown(players, md_filename)
+        md_content = generate_markdown(schedule, minutes_per_player, slot_duration, players, md_filename)
     
     # Print to console if requested or no output file specified
     if args.print or not args.output: